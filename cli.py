@@ -3,11 +3,9 @@
 LinkedIn Bot CLI - Command line interface for the LinkedIn posting bot
 """
 
-import argparse
 import sys
-from linkedin_bot import LinkedInBot
-from content_generator import ContentGenerator
 import logging
+from types import SimpleNamespace
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration"""
@@ -17,7 +15,14 @@ def setup_logging(verbose: bool = False):
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
 
-def main():
+# Fixed command set, parsed inline so the common invocations never import argparse
+COMMANDS = ('start', 'post', 'test', 'generate', 'next')
+TOPIC_COMMANDS = ('post', 'generate')
+
+def build_parser():
+    """Build the full argparse parser, used for help text and error reporting"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description='LinkedIn Bot for Frontend Tech Posts')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
     
@@ -40,23 +45,56 @@ def main():
     # Show next post time
     next_parser = subparsers.add_parser('next', help='Show next scheduled post time')
     
-    args = parser.parse_args()
+    return parser
+
+def parse_args(argv=None):
+    """Parse command line arguments, falling back to argparse for help or unexpected input"""
+    argv = sys.argv[1:] if argv is None else argv
+    command = None
+    topic = None
+    verbose = False
+    
+    pos = 0
+    while pos < len(argv):
+        arg = argv[pos]
+        if arg in ('-v', '--verbose'):
+            verbose = True
+        elif command is None and arg in COMMANDS:
+            command = arg
+        elif command in TOPIC_COMMANDS and arg in ('-t', '--topic') and pos + 1 < len(argv):
+            pos += 1
+            topic = argv[pos]
+        elif command in TOPIC_COMMANDS and arg.startswith('--topic='):
+            topic = arg[len('--topic='):]
+        else:
+            # --help, typos and anything else get argparse's usual handling
+            return build_parser().parse_args(argv)
+        pos += 1
+    
+    return SimpleNamespace(command=command, topic=topic, verbose=verbose)
+
+def main():
+    args = parse_args()
     
     if not args.command:
-        parser.print_help()
+        build_parser().print_help()
         return
     
+    if args.command != 'generate':
+        # Imported before setup_logging so the bot's file + console logging takes effect
+        from linkedin_bot import LinkedInBot
+    
     setup_logging(args.verbose)
     
     try:
-        bot = LinkedInBot()
-        
         if args.command == 'start':
             print("Starting LinkedIn Bot...")
+            bot = LinkedInBot()
             bot.start_scheduler()
             
         elif args.command == 'post':
             print(f"Creating immediate post{' for topic: ' + args.topic if args.topic else ''}...")
+            bot = LinkedInBot()
             success = bot.post_now(args.topic)
             if success:
                 print("✅ Post created successfully!")
@@ -66,6 +104,7 @@ def main():
                 
         elif args.command == 'test':
             print("Testing LinkedIn API connection...")
+            bot = LinkedInBot()
             success = bot.test_connection()
             if success:
                 print("✅ LinkedIn API connection successful!")
@@ -74,6 +113,7 @@ def main():
                 sys.exit(1)
                 
         elif args.command == 'generate':
+            from content_generator import ContentGenerator
             generator = ContentGenerator()
             topic = args.topic or generator.get_random_topic()
             print(f"Generating content for topic: {topic}")
@@ -85,6 +125,7 @@ def main():
             print("="*50)
             
         elif args.command == 'next':
+            bot = LinkedInBot()
             next_time = bot.get_next_post_time()
             print(f"Next scheduled post: {next_time}")
             
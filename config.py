@@ -1,11 +1,66 @@
 import os
+import json
+import time
 import logging
+import functools
 from dotenv import load_dotenv
 from datetime import datetime
-import pytz
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+    import pytz
 
 logger = logging.getLogger(__name__)
 
+# Local cache of Secret Manager values so warm instances skip the network fetch. It lives in
+# a per-user directory and is only trusted when owned by this user and private to them.
+SECRETS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'linkedin-bot')
+SECRETS_CACHE_FILE = os.getenv('SECRETS_CACHE_FILE', os.path.join(SECRETS_CACHE_DIR, 'secrets.json'))
+SECRETS_CACHE_TTL = int(os.getenv('SECRETS_CACHE_TTL', '3600'))
+
+def _is_private(stat_result):
+    """True if a file belongs to the current user and no one else can read or write it"""
+    if hasattr(os, 'getuid') and stat_result.st_uid != os.getuid():
+        return False
+    return not stat_result.st_mode & 0o077
+
+def _read_secrets_cache(project_id, secret_id, max_age=None):
+    """Return cached secrets for (project_id, secret_id), or None if missing, untrusted, malformed or stale"""
+    try:
+        with open(SECRETS_CACHE_FILE) as f:
+            stat_result = os.fstat(f.fileno())
+            if not _is_private(stat_result):
+                logger.warning(f"Ignoring secrets cache not private to this user: {SECRETS_CACHE_FILE}")
+                return None
+            if max_age is not None and time.time() - stat_result.st_mtime >= max_age:
+                return None
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get('project_id') != project_id or cached.get('secret_id') != secret_id:
+        return None
+    env = cached.get('env')
+    if not env or not isinstance(env, dict):
+        return None
+    if not all(isinstance(key, str) and isinstance(value, str) for key, value in env.items()):
+        return None
+    return env
+
+def _write_secrets_cache(project_id, secret_id, env_vars):
+    """Write secrets to the cache file, readable only by the current user"""
+    tmp_path = SECRETS_CACHE_FILE + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(SECRETS_CACHE_FILE), mode=0o700, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'project_id': project_id, 'secret_id': secret_id, 'env': env_vars}, f)
+        os.replace(tmp_path, SECRETS_CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Could not write secrets cache: {e}")
+
 # Load environment variables
 # Priority: 1. GCP Secret Manager, 2. .env file
 def load_environment():
@@ -16,22 +71,39 @@ def load_environment():
     
     if is_cloud_environment or os.getenv('USE_SECRET_MANAGER', '').lower() == 'true':
         # Running in cloud or explicitly requested to use Secret Manager
+        secret_id = os.getenv('SECRET_ID', 'linkedin-bot')
+        project_id = os.getenv('GCP_PROJECT')
+        
+        cached = _read_secrets_cache(project_id, secret_id, SECRETS_CACHE_TTL)
+        if cached:
+            os.environ.update(cached)
+            logger.info("Loaded secrets from local cache")
+            return
+        
         logger.info("Attempting to load secrets from GCP Secret Manager...")
         try:
-            from secrets_manager import load_secrets_from_gcp
-            
-            secret_id = os.getenv('SECRET_ID', 'linkedin-bot')
-            project_id = os.getenv('GCP_PROJECT')
+            from secrets_manager import fetch_secrets_from_gcp
             
-            if load_secrets_from_gcp(secret_id, project_id):
+            env_vars = fetch_secrets_from_gcp(secret_id, project_id)
+            if env_vars:
+                os.environ.update(env_vars)
+                _write_secrets_cache(project_id, secret_id, env_vars)
                 logger.info("Successfully loaded secrets from GCP Secret Manager")
                 return
             else:
-                logger.warning("Failed to load from Secret Manager, falling back to .env file")
+                logger.warning("Failed to load from Secret Manager")
         except ImportError:
-            logger.warning("secrets_manager module not available, falling back to .env file")
+            logger.warning("secrets_manager module not available")
         except Exception as e:
-            logger.warning(f"Error loading from Secret Manager: {e}, falling back to .env file")
+            logger.warning(f"Error loading from Secret Manager: {e}")
+        
+        # Keep booting with stale secrets rather than none at all
+        stale = _read_secrets_cache(project_id, secret_id)
+        if stale:
+            os.environ.update(stale)
+            logger.warning("Using stale cached secrets")
+            return
+        logger.warning("No cached secrets available, falling back to .env file")
     
     # Fall back to .env file for local development
     logger.info("Loading environment variables from .env file")
@@ -39,39 +111,47 @@ def load_environment():
 
 load_environment()
 
+# Snapshot the environment once, after secrets/.env have been loaded
+_ENV = dict(os.environ)
+
 class Config:
     # LinkedIn API Configuration
-    LINKEDIN_CLIENT_ID = os.getenv('LINKEDIN_CLIENT_ID')
-    LINKEDIN_CLIENT_SECRET = os.getenv('LINKEDIN_CLIENT_SECRET')
-    LINKEDIN_REDIRECT_URI = os.getenv('LINKEDIN_REDIRECT_URI', 'http://localhost:8080/callback')
-    LINKEDIN_ACCESS_TOKEN = os.getenv('LINKEDIN_ACCESS_TOKEN')
+    LINKEDIN_CLIENT_ID = _ENV.get('LINKEDIN_CLIENT_ID')
+    LINKEDIN_CLIENT_SECRET = _ENV.get('LINKEDIN_CLIENT_SECRET')
+    LINKEDIN_REDIRECT_URI = _ENV.get('LINKEDIN_REDIRECT_URI', 'http://localhost:8080/callback')
+    LINKEDIN_ACCESS_TOKEN = _ENV.get('LINKEDIN_ACCESS_TOKEN')
     
     # AI Model Configuration
-    GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
+    LLM_PROVIDER = _ENV.get('LLM_PROVIDER', 'gemini').lower()
+    GEMINI_API_KEY = _ENV.get('GEMINI_API_KEY')
+    GEMINI_MODEL = _ENV.get('GEMINI_MODEL', 'gemini-2.5-flash')
+    OPENAI_API_KEY = _ENV.get('OPENAI_API_KEY')
+    OPENAI_MODEL = _ENV.get('OPENAI_MODEL', 'gpt-4o-mini')
     
     # Bot Configuration
-    POST_TIME = os.getenv('POST_TIME', '03:00')
-    TIMEZONE = os.getenv('TIMEZONE', 'Asia/Kolkata')
+    POST_TIME = _ENV.get('POST_TIME', '03:00')
+    TIMEZONE = _ENV.get('TIMEZONE', 'Asia/Kolkata')
+    
+    # Seconds a generated post stays fresh in the generator cache (default: 6 hours)
+    POST_CACHE_TTL = int(_ENV.get('POST_CACHE_TTL', '21600'))
     
     # LinkedIn API URLs
     LINKEDIN_API_BASE = 'https://api.linkedin.com/v2'
     LINKEDIN_AUTH_URL = 'https://www.linkedin.com/oauth/v2/authorization'
     LINKEDIN_TOKEN_URL = 'https://www.linkedin.com/oauth/v2/accessToken'
     
+    # Required (name, value) pairs, captured once at class creation
+    REQUIRED_VARS = (
+        ('LINKEDIN_CLIENT_ID', LINKEDIN_CLIENT_ID),
+        ('LINKEDIN_CLIENT_SECRET', LINKEDIN_CLIENT_SECRET),
+        ('LINKEDIN_ACCESS_TOKEN', LINKEDIN_ACCESS_TOKEN),
+        ('OPENAI_API_KEY', OPENAI_API_KEY) if LLM_PROVIDER == 'openai' else ('GEMINI_API_KEY', GEMINI_API_KEY)
+    )
+    
     @classmethod
     def validate_config(cls):
         """Validate that all required configuration is present"""
-        required_vars = [
-            'LINKEDIN_CLIENT_ID',
-            'LINKEDIN_CLIENT_SECRET', 
-            'LINKEDIN_ACCESS_TOKEN',
-            'GEMINI_API_KEY'
-        ]
-        
-        missing_vars = []
-        for var in required_vars:
-            if not getattr(cls, var):
-                missing_vars.append(var)
+        missing_vars = [name for name, value in cls.REQUIRED_VARS if not value]
         
         if missing_vars:
             raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
@@ -79,6 +159,9 @@ class Config:
         return True
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def get_timezone(cls):
-        """Get timezone object"""
+        """Get timezone object (built once, TIMEZONE is fixed for the process)"""
+        if ZoneInfo is not None:
+            return ZoneInfo(cls.TIMEZONE)
         return pytz.timezone(cls.TIMEZONE)
@@ -1,181 +1,252 @@
-import google.generativeai as genai
+import asyncio
 import random
-from typing import List, Dict, Any
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from config import Config
+from providers import LLMProvider, get_provider
+
+# Posts in a batched response are separated by a line containing only this marker
+BATCH_DELIMITER = "---"
+_BATCH_SPLIT_RE = re.compile(rf'^\s*{re.escape(BATCH_DELIMITER)}\s*$', re.MULTILINE)
+# "Post N:" labels the model sometimes echoes from the batch prompt
+_POST_LABEL_RE = re.compile(r'^\s*Post \d+:\s*')
+
+_choice = random.choice
+_randrange = random.randrange
+
+# Frontend technology topics and trends
+_FRONTEND_TOPICS = tuple(sys.intern(t) for t in (
+    "React.js", "Next.js",
+    "TypeScript", "JavaScript ES6+", "Flexbox", "Tailwind CSS",
+    "Web Components", "WebAssembly", "WebRTC",
+    "GraphQL", "REST APIs", "Micro-frontends", "Server-Side Rendering",
+    "Static Site Generation", "JAMstack", "Webpack", "Vite", "Parcel",
+    "Testing", "Jest", "Cypress", "Playwright", "Accessibility", "Performance",
+    "Bundle Optimization", "Code Splitting", "Lazy Loading", "Caching Strategies"
+))
+
+# Prompt templates, formatted with the post topic (and compare_topic for comparisons)
+TIP_PROMPT = """Create a LinkedIn post about a useful tip for {topic} developers.
+The post should be:
+- Engaging and professional
+- Include a practical tip or insight
+- Be 2-3 sentences long
+- Include relevant hashtags
+- Start with "💡 Frontend Tip:" or similar
+"""
+
+TUTORIAL_PROMPT = """Create a LinkedIn post that shares a quick tutorial or how-to about {topic}.
+The post should be:
+- Educational and actionable
+- Include step-by-step guidance or key concepts
+- Be 3-4 sentences long
+- Include relevant hashtags
+- Start with "🚀 Quick Tutorial:" or similar
+"""
+
+TREND_PROMPT = """Create a LinkedIn post analyzing current trends or future outlook for {topic}.
+The post should be:
+- Insightful and forward-thinking
+- Include industry perspective
+- Be 3-4 sentences long
+- Include relevant hashtags
+- Start with "📈 Trend Watch:" or similar
+"""
+
+COMPARISON_PROMPT = """Create a LinkedIn post comparing {topic} with {compare_topic}.
+The post should be:
+- Balanced and informative
+- Highlight key differences or use cases
+- Be 3-4 sentences long
+- Include relevant hashtags
+- Start with "⚖️ Comparison:" or similar
+"""
+
+BEST_PRACTICE_PROMPT = """Create a LinkedIn post sharing best practices for {topic}.
+The post should be:
+- Professional and authoritative
+- Include practical advice
+- Be 3-4 sentences long
+- Include relevant hashtags
+- Start with "✨ Best Practice:" or similar
+"""
+
+TROUBLESHOOTING_PROMPT = """Create a LinkedIn post about a common issue developers face with {topic} and how to solve it.
+The post should be:
+- Problem-solving focused
+- Include a solution or workaround
+- Be 3-4 sentences long
+- Include relevant hashtags
+- Start with "🔧 Troubleshooting:" or similar
+"""
+
+# Template name -> (prompt format string, max output tokens)
+TEMPLATES = {
+    "tip_template": (TIP_PROMPT, 200),
+    "tutorial_template": (TUTORIAL_PROMPT, 300),
+    "trend_analysis_template": (TREND_PROMPT, 300),
+    "comparison_template": (COMPARISON_PROMPT, 300),
+    "best_practice_template": (BEST_PRACTICE_PROMPT, 300),
+    "troubleshooting_template": (TROUBLESHOOTING_PROMPT, 300)
+}
 
 class ContentGenerator:
-    """Generate engaging frontend technology content for LinkedIn posts using Gemini"""
+    """Generate engaging frontend technology content for LinkedIn posts using an LLM provider"""
     
-    def __init__(self):
-        # Configure Gemini
-        genai.configure(api_key=Config.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        # Frontend technology topics and trends
-        self.frontend_topics = [
-            "React.js", "Next.js",
-            "TypeScript", "JavaScript ES6+", "Flexbox", "Tailwind CSS",
-            "Web Components", "WebAssembly", "WebRTC",
-            "GraphQL", "REST APIs", "Micro-frontends", "Server-Side Rendering",
-            "Static Site Generation", "JAMstack", "Webpack", "Vite", "Parcel",
-            "Testing", "Jest", "Cypress", "Playwright", "Accessibility", "Performance",
-            "Bundle Optimization", "Code Splitting", "Lazy Loading", "Caching Strategies"
-        ]
+    def __init__(self, provider: Optional[LLMProvider] = None, batch_size: int = 1):
+        # Provider defaults to the one selected by Config.LLM_PROVIDER
+        self.provider = provider or get_provider()
         
-        # Post templates and structures
-        self.post_templates = [
-            "tip_template",
-            "tutorial_template", 
-            "trend_analysis_template",
-            "comparison_template",
-            "best_practice_template",
-            "troubleshooting_template"
-        ]
+        # Random-topic posts generated per provider call; >1 queues the extras for later calls
+        self.batch_size = batch_size
+        
+        # Frontend technology topics and trends, shared by all instances
+        self.frontend_topics = _FRONTEND_TOPICS
+        
+        self._n_topics = len(self.frontend_topics)
+        
+        # Hashtag form of each topic, e.g. "Next.js" -> "Nextjs"
+        self._topic_tag = {t: t.replace('.', '').replace(' ', '') for t in self.frontend_topics}
+        self._default_tags = "#FrontendDevelopment #WebDevelopment #JavaScript"
+        
+        # Post templates: name -> (prompt format string, max output tokens)
+        self._templates = TEMPLATES
+        self.post_templates = list(self._templates)
+        
+        # Posts generated ahead of time by generate_batch
+        self._post_queue = deque()
+        
+        # (template, topic) -> (monotonic timestamp, post text)
+        # Entries expire hard after cache_ttl: an expired post is never served, since publishing
+        # it again would repeat an old post verbatim
+        self._cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self.cache_ttl = Config.POST_CACHE_TTL
     
     def generate_post(self, topic: str = None) -> str:
-        """Generate a LinkedIn post about frontend technology using Gemini"""
+        """Generate a LinkedIn post about frontend technology using the LLM provider"""
         if not topic:
-            topic = random.choice(self.frontend_topics)
+            # Random-topic posts are served from the batch queue, refilling it when empty
+            if self.batch_size > 1 and not self._post_queue:
+                try:
+                    self.generate_batch(self.batch_size)
+                except Exception as e:
+                    print(f"Error generating post batch: {e}")
+            if self._post_queue:
+                return self._post_queue.popleft()
+            topic = _choice(self.frontend_topics)
         
-        template = random.choice(self.post_templates)
+        template = _choice(self.post_templates)
+        key = (template, topic)
         
-        try:
-            if template == "tip_template":
-                return self._generate_tip_post(topic)
-            elif template == "tutorial_template":
-                return self._generate_tutorial_post(topic)
-            elif template == "trend_analysis_template":
-                return self._generate_trend_post(topic)
-            elif template == "comparison_template":
-                return self._generate_comparison_post(topic)
-            elif template == "best_practice_template":
-                return self._generate_best_practice_post(topic)
-            elif template == "troubleshooting_template":
-                return self._generate_troubleshooting_post(topic)
-        except Exception as e:
-            print(f"Error generating post with Gemini: {e}")
-            return self._generate_fallback_post(topic)
-    
-    def _generate_tip_post(self, topic: str) -> str:
-        """Generate a quick tip post using Gemini"""
-        prompt = f"""
-        Create a LinkedIn post about a useful tip for {topic} developers.
-        The post should be:
-        - Engaging and professional
-        - Include a practical tip or insight
-        - Be 2-3 sentences long
-        - Include relevant hashtags
-        - Start with "💡 Frontend Tip:" or similar
-        """
+        cached = self._cache.get(key)
+        if cached:
+            timestamp, post = cached
+            if time.monotonic() - timestamp < self.cache_ttl:
+                return post
+            del self._cache[key]
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._generate_and_cache(key)
         except Exception as e:
-            print(f"Gemini API error: {e}")
+            print(f"Error generating post: {e}")
             return self._generate_fallback_post(topic)
     
-    def _generate_tutorial_post(self, topic: str) -> str:
-        """Generate a mini-tutorial post using Gemini"""
-        prompt = f"""
-        Create a LinkedIn post that shares a quick tutorial or how-to about {topic}.
-        The post should be:
-        - Educational and actionable
-        - Include step-by-step guidance or key concepts
-        - Be 3-4 sentences long
-        - Include relevant hashtags
-        - Start with "🚀 Quick Tutorial:" or similar
-        """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            print(f"Gemini API error: {e}")
-            return self._generate_fallback_post(topic)
+    def _generate_and_cache(self, key: Tuple[str, str]) -> str:
+        """Generate a post for a (template, topic) key and store it in the cache"""
+        prompt, max_tokens = self._build_prompt(*key)
+        post = self.provider.generate(prompt, max_tokens, early_stop=True)
+        if not post:
+            # Never cache (or publish) an empty post; generate_post falls back instead
+            raise ValueError("Provider returned no post text")
+        self._cache[key] = (time.monotonic(), post)
+        return post
     
-    def _generate_trend_post(self, topic: str) -> str:
-        """Generate a trend analysis post using Gemini"""
-        prompt = f"""
-        Create a LinkedIn post analyzing current trends or future outlook for {topic}.
-        The post should be:
-        - Insightful and forward-thinking
-        - Include industry perspective
-        - Be 3-4 sentences long
-        - Include relevant hashtags
-        - Start with "📈 Trend Watch:" or similar
-        """
+    def generate_batch(self, n: int = 8) -> List[str]:
+        """Generate n posts on random topics/templates in a single provider call and queue them"""
+        # Bind lookups used on every iteration to locals
+        choice = _choice
+        build_prompt = self._build_prompt
+        templates = self.post_templates
+        topics = self.frontend_topics
         
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            print(f"Gemini API error: {e}")
-            return self._generate_fallback_post(topic)
-    
-    def _generate_comparison_post(self, topic: str) -> str:
-        """Generate a comparison post using Gemini"""
-        related_topics = [t for t in self.frontend_topics if t != topic]
-        compare_topic = random.choice(related_topics)
-        
-        prompt = f"""
-        Create a LinkedIn post comparing {topic} with {compare_topic}.
-        The post should be:
-        - Balanced and informative
-        - Highlight key differences or use cases
-        - Be 3-4 sentences long
-        - Include relevant hashtags
-        - Start with "⚖️ Comparison:" or similar
-        """
+        prompts = []
+        for i in range(1, n + 1):
+            prompt, _ = build_prompt(choice(templates), choice(topics))
+            prompts.append(f"Post {i}:\n{prompt}")
         
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            print(f"Gemini API error: {e}")
-            return self._generate_fallback_post(topic)
+        batch_prompt = (
+            f"Generate {n} distinct LinkedIn posts, one for each request below.\n"
+            f"Separate the posts with a line containing only {BATCH_DELIMITER}.\n"
+            f"Do not number the posts or add any other text.\n\n" + "\n".join(prompts)
+        )
+        
+        text = self.provider.generate(batch_prompt, n * 250)
+        strip = str.strip
+        label = _POST_LABEL_RE.sub
+        posts = [label('', post, 1) for post in map(strip, _BATCH_SPLIT_RE.split(text)) if post]
+        if len(posts) != n or not all(posts):
+            # The model ignored the delimiter (or merged/split posts), so none of them can be trusted
+            raise ValueError(f"Expected {n} posts in batch response, got {len(posts)}")
+        self._post_queue.extend(posts)
+        return posts
     
-    def _generate_best_practice_post(self, topic: str) -> str:
-        """Generate a best practices post using Gemini"""
-        prompt = f"""
-        Create a LinkedIn post sharing best practices for {topic}.
-        The post should be:
-        - Professional and authoritative
-        - Include practical advice
-        - Be 3-4 sentences long
-        - Include relevant hashtags
-        - Start with "✨ Best Practice:" or similar
-        """
+    def generate_posts(self, topics: List[str]) -> List[str]:
+        """Generate one post per topic with all provider requests in flight concurrently"""
+        # Threads over the sync provider calls, which use pooled clients not bound to any event loop
+        choice = _choice
+        build_prompt = self._build_prompt
+        generate = self.provider.generate
+        templates = self.post_templates
         
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            print(f"Gemini API error: {e}")
-            return self._generate_fallback_post(topic)
+        prompts = [build_prompt(choice(templates), topic) for topic in topics]
+        with ThreadPoolExecutor(max_workers=max(len(prompts), 1)) as executor:
+            futures = [executor.submit(generate, prompt, max_tokens) for prompt, max_tokens in prompts]
+            results = [future.exception() or future.result() for future in futures]
+        return self._posts_or_fallbacks(topics, results)
     
-    def _generate_troubleshooting_post(self, topic: str) -> str:
-        """Generate a troubleshooting post using Gemini"""
-        prompt = f"""
-        Create a LinkedIn post about a common issue developers face with {topic} and how to solve it.
-        The post should be:
-        - Problem-solving focused
-        - Include a solution or workaround
-        - Be 3-4 sentences long
-        - Include relevant hashtags
-        - Start with "🔧 Troubleshooting:" or similar
-        """
+    async def generate_posts_async(self, topics: List[str]) -> List[str]:
+        """Async variant of generate_posts for callers already running an event loop"""
+        choice = _choice
+        build_prompt = self._build_prompt
+        generate_async = self.provider.generate_async
+        templates = self.post_templates
         
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            print(f"Gemini API error: {e}")
-            return self._generate_fallback_post(topic)
+        prompts = [build_prompt(choice(templates), topic) for topic in topics]
+        results = await asyncio.gather(
+            *[generate_async(prompt, max_tokens) for prompt, max_tokens in prompts],
+            return_exceptions=True
+        )
+        return self._posts_or_fallbacks(topics, results)
+    
+    def _posts_or_fallbacks(self, topics: List[str], results: List[Any]) -> List[str]:
+        """Replace failed (or empty) generations with fallback posts"""
+        posts = []
+        for topic, result in zip(topics, results):
+            if isinstance(result, Exception) or not result:
+                print(f"Error generating post: {result or 'empty response'}")
+                result = self._generate_fallback_post(topic)
+            posts.append(result)
+        return posts
+    
+    def _build_prompt(self, template: str, topic: str) -> Tuple[str, int]:
+        """Format the prompt for a template and return it with its token budget"""
+        prompt_template, max_tokens = self._templates[template]
+        if template == "comparison_template":
+            # Pick from the first n-1 topics, substituting the last one if we hit the topic itself
+            topics = self.frontend_topics
+            compare_topic = topics[_randrange(self._n_topics - 1)]
+            if compare_topic == topic:
+                compare_topic = topics[-1]
+            return prompt_template.format(topic=topic, compare_topic=compare_topic), max_tokens
+        return prompt_template.format(topic=topic), max_tokens
     
     def _generate_fallback_post(self, topic: str) -> str:
-        """Generate a simple fallback post if Gemini generation fails"""
+        """Generate a simple fallback post if LLM generation fails"""
         tips = [
             f"💡 {topic} tip: Always keep your dependencies updated for better security and performance!",
             f"🚀 Working with {topic}? Remember to optimize your bundle size for faster load times.",
@@ -184,22 +255,15 @@ class ContentGenerator:
             f"🔧 Common {topic} issue? Check your console for errors and use debugging tools effectively."
         ]
         
-        return random.choice(tips) + f"\n\n#FrontendDevelopment #{topic.replace('.', '').replace(' ', '')} #WebDevelopment #TechTips"
+        tag = self._topic_tag.get(topic) or topic.replace('.', '').replace(' ', '')
+        return f"{_choice(tips)}\n\n#FrontendDevelopment #{tag} #WebDevelopment #TechTips"
     
     def get_random_topic(self) -> str:
         """Get a random frontend topic"""
-        return random.choice(self.frontend_topics)
+        return _choice(self.frontend_topics)
     
     def add_hashtags(self, post: str) -> str:
         """Add relevant hashtags to a post if not already present"""
         if "#" not in post:
-            hashtags = [
-                "#FrontendDevelopment",
-                "#WebDevelopment", 
-                "#JavaScript",
-                "#TechTips",
-                "#Programming",
-                "#SoftwareDevelopment"
-            ]
-            return post + "\n\n" + " ".join(hashtags[:3])
+            return f"{post}\n\n{self._default_tags}"
         return post
\ No newline at end of file
@@ -1,8 +1,103 @@
+import os
+import hashlib
 import requests
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import Config
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder where the wheel is unavailable
+    orjson = None
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a request payload to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def _loads(content: bytes) -> Any:
+    """Deserialize a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Profile IDs never change for a token, so they are cached on disk keyed by token fingerprint
+PROFILE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'linkedin-bot')
+
+def _close_response(future: Future):
+    """Done-callback that releases a streamed response's connection"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+# Placeholder for the post text in the pre-serialized text post body, and its JSON-encoded form
+_TEXT_SENTINEL = "\x00TEXT\x00"
+_ENCODED_TEXT_SENTINEL = _dumps(_TEXT_SENTINEL)[1:-1]
+
+def _build_ugc_post(author_urn: str, text: str, media: Optional[list] = None) -> Dict[str, Any]:
+    """Build a ugcPosts payload; only the text and optional media vary between posts"""
+    share_content = {
+        "shareCommentary": {
+            "text": text
+        },
+        "shareMediaCategory": "IMAGE" if media else "NONE"
+    }
+    if media:
+        share_content["media"] = media
+    
+    return {
+        "author": author_urn,
+        "lifecycleState": "PUBLISHED",
+        "specificContent": {
+            "com.linkedin.ugc.ShareContent": share_content
+        },
+        "visibility": {
+            "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
+        }
+    }
+
+# Transient failures (rate limits, 5xx, dropped connections) are retried with exponential
+# backoff, honouring Retry-After
+DEFAULT_RETRY = Retry(
+    total=5,
+    connect=3,
+    read=3,
+    status=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'POST']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Publishing is not idempotent: a read error or 5xx may arrive after LinkedIn created the post,
+# so only retry failures where nothing was processed (connection errors and 429)
+PUBLISH_RETRY = DEFAULT_RETRY.new(read=0, status_forcelist=(429,))
+
+# No retries at all (requests' own default), for streamed bodies that cannot be replayed and
+# for single-use requests such as the OAuth code exchange
+NO_RETRY = Retry(0, read=False)
+
+def create_session(headers: Optional[Dict[str, str]] = None, retry: Retry = DEFAULT_RETRY) -> requests.Session:
+    """Create a requests session with pooled keep-alive connections and retries"""
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+def _shared_pool_adapter(pool_source: HTTPAdapter, retry: Retry) -> HTTPAdapter:
+    """Adapter with its own retry policy that sends over another adapter's connection pool"""
+    # HTTPAdapter.send passes its max_retries per request, so pools can be shared across policies
+    adapter = HTTPAdapter(max_retries=retry)
+    adapter.poolmanager = pool_source.poolmanager
+    return adapter
+
 class LinkedInAPI:
     """LinkedIn API integration for posting content"""
     
@@ -14,26 +109,121 @@ class LinkedInAPI:
             'Content-Type': 'application/json',
             'X-Restli-Protocol-Version': '2.0.0'
         }
+        
+        self._ugc_url = f'{self.base_url}/ugcPosts'
+        self._register_upload_url = f'{self.base_url}/assets?action=registerUpload'
+        
+        # Reuse TLS connections to api.linkedin.com across calls
+        self.session = create_session(self.headers)
+        api_adapter = self.session.get_adapter(self.base_url)
+        self.session.mount(self._ugc_url, _shared_pool_adapter(api_adapter, PUBLISH_RETRY))
+        # Images come from third-party hosts, which must not see the LinkedIn token
+        self.media_session = create_session()
+        # The streamed image body cannot be rewound, so uploads are never retried; they still
+        # reuse the API connections for register, upload and publish
+        self.upload_session = requests.Session()
+        self.upload_session.headers.update(self.headers)
+        self.upload_session.mount('https://', _shared_pool_adapter(api_adapter, NO_RETRY))
+        
+        # Profile ID is looked up once per token; a 401 drops the cached value
+        self._profile_id: Optional[str] = None
+        self._author_urn: Optional[str] = None
+        self._text_post_template: Optional[bytes] = None
+        fingerprint = hashlib.sha256((self.access_token or '').encode()).hexdigest()[:16]
+        self._profile_cache_file = os.path.join(PROFILE_CACHE_DIR, f'profile_id-{fingerprint}.json')
+        self.session.hooks['response'].append(self._invalidate_on_unauthorized)
+    
+    def close(self):
+        """Close the underlying HTTP sessions"""
+        self.session.close()
+        self.media_session.close()
+        self.upload_session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _request(self, method: str, url: str, json_body: Any = None,
+                 session: Optional[requests.Session] = None, decode: bool = True, **kwargs) -> Dict[str, Any]:
+        """Send a request (on the API session unless another is given) and decode the JSON response
+        
+        Failures, including a body that is not valid JSON, are reported here once and raised to
+        the caller as RequestException. With decode=False the body is ignored and {} returned.
+        """
+        if json_body is not None:
+            kwargs['data'] = _dumps(json_body)
+        try:
+            response = (session or self.session).request(method, url, **kwargs)
+            response.raise_for_status()
+            if not decode or not response.content:
+                return {}
+            try:
+                return _loads(response.content)
+            except ValueError as e:
+                # Surface like requests' own response.json() failure, which is a RequestException
+                raise requests.exceptions.InvalidJSONError(f"Invalid JSON in response: {e}", response=response) from e
+        except requests.exceptions.RequestException as e:
+            print(f"Error in LinkedIn API request {method} {url}: {e}")
+            if e.response is not None:
+                print(f"Response content: {e.response.text}")
+            raise
     
     def get_profile_info(self) -> Dict[str, Any]:
         """Get current user's profile information"""
         try:
             # Use the working OpenID Connect endpoint
-            response = requests.get(
-                'https://api.linkedin.com/v2/userinfo',
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting profile info: {e}")
+            return self._request('GET', 'https://api.linkedin.com/v2/userinfo')
+        except requests.exceptions.RequestException:
             return {}
     
     def get_profile_id(self) -> Optional[str]:
         """Get the user's LinkedIn profile ID"""
-        profile = self.get_profile_info()
-        # OpenID Connect endpoint returns 'sub' field as the user ID
-        return profile.get('sub')
+        if self._profile_id:
+            return self._profile_id
+        
+        profile_id = self._read_cached_profile_id()
+        if not profile_id:
+            profile = self.get_profile_info()
+            # OpenID Connect endpoint returns 'sub' field as the user ID
+            profile_id = profile.get('sub')
+            if profile_id:
+                self._write_cached_profile_id(profile_id)
+        
+        self._profile_id = profile_id
+        self._author_urn = f'urn:li:person:{profile_id}' if profile_id else None
+        # Text posts only differ in their text, so serialize the rest of the body once
+        self._text_post_template = _dumps(_build_ugc_post(self._author_urn, _TEXT_SENTINEL)) if profile_id else None
+        return profile_id
+    
+    def _read_cached_profile_id(self) -> Optional[str]:
+        """Read the profile ID cached on disk for this access token"""
+        try:
+            with open(self._profile_cache_file, 'rb') as f:
+                return _loads(f.read()).get('profile_id')
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cached_profile_id(self, profile_id: str):
+        """Cache the profile ID on disk for this access token"""
+        try:
+            os.makedirs(PROFILE_CACHE_DIR, exist_ok=True)
+            with open(self._profile_cache_file, 'wb') as f:
+                f.write(_dumps({'profile_id': profile_id}))
+        except OSError as e:
+            print(f"Could not cache profile ID: {e}")
+    
+    def _invalidate_on_unauthorized(self, response, *args, **kwargs):
+        """Session response hook that forgets the cached profile ID when the token is rejected"""
+        if response.status_code == 401:
+            self._profile_id = None
+            self._author_urn = None
+            self._text_post_template = None
+            try:
+                os.remove(self._profile_cache_file)
+            except OSError:
+                pass
     
     def create_text_post(self, text: str) -> Dict[str, Any]:
         """Create a text-only post on LinkedIn"""
@@ -41,36 +231,13 @@ class LinkedInAPI:
         if not profile_id:
             raise ValueError("Could not retrieve profile ID")
         
-        # Prepare the post data
-        post_data = {
-            "author": f"urn:li:person:{profile_id}",
-            "lifecycleState": "PUBLISHED",
-            "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {
-                        "text": text
-                    },
-                    "shareMediaCategory": "NONE"
-                }
-            },
-            "visibility": {
-                "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-            }
-        }
+        # Prepare the post data by substituting the encoded text into the pre-serialized body
+        if _TEXT_SENTINEL in text:
+            body = _dumps(_build_ugc_post(self._author_urn, text))
+        else:
+            body = self._text_post_template.replace(_ENCODED_TEXT_SENTINEL, _dumps(text)[1:-1], 1)
         
-        try:
-            response = requests.post(
-                f'{self.base_url}/ugcPosts',
-                headers=self.headers,
-                data=json.dumps(post_data)
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error creating post: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Response content: {e.response.text}")
-            raise
+        return self._request('POST', self._ugc_url, data=body)
     
     def create_post_with_image(self, text: str, image_url: str) -> Dict[str, Any]:
         """Create a post with an image"""
@@ -82,7 +249,7 @@ class LinkedInAPI:
         image_data = {
             "registerUploadRequest": {
                 "recipes": ["urn:li:digitalmediaRecipe:feedshare-image"],
-                "owner": f"urn:li:person:{profile_id}",
+                "owner": self._author_urn,
                 "serviceRelationships": [
                     {
                         "relationshipType": "OWNER",
@@ -92,71 +259,59 @@ class LinkedInAPI:
             }
         }
         
+        # Open the source image on a worker thread while the upload is being registered
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            image_future = executor.submit(self._open_image, image_url)
+            try:
+                return self._upload_image_and_post(text, image_data, image_future)
+            finally:
+                # Release the image connection, including when registration failed first
+                image_future.add_done_callback(_close_response)
+    
+    def _open_image(self, image_url: str) -> requests.Response:
+        """Start a streamed download of the source image"""
+        image_response = self.media_session.get(image_url, stream=True)
         try:
-            # Register the image upload
-            upload_response = requests.post(
-                f'{self.base_url}/assets?action=registerUpload',
-                headers=self.headers,
-                data=json.dumps(image_data)
-            )
-            upload_response.raise_for_status()
-            upload_data = upload_response.json()
-            
-            # Upload the image
-            upload_url = upload_data['value']['uploadMechanism']['com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest']['uploadUrl']
-            asset_id = upload_data['value']['asset']
-            
-            # Download and upload the image
-            image_response = requests.get(image_url)
             image_response.raise_for_status()
-            
-            upload_headers = upload_data['value']['uploadMechanism']['com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest']['headers']
-            upload_headers['Content-Type'] = 'application/octet-stream'
-            
-            requests.post(upload_url, headers=upload_headers, data=image_response.content)
-            
-            # Create the post with image
-            post_data = {
-                "author": f"urn:li:person:{profile_id}",
-                "lifecycleState": "PUBLISHED",
-                "specificContent": {
-                    "com.linkedin.ugc.ShareContent": {
-                        "shareCommentary": {
-                            "text": text
-                        },
-                        "shareMediaCategory": "IMAGE",
-                        "media": [
-                            {
-                                "status": "READY",
-                                "description": {
-                                    "text": "Frontend technology insight"
-                                },
-                                "media": asset_id,
-                                "title": {
-                                    "text": "Frontend Tech"
-                                }
-                            }
-                        ]
-                    }
+        except requests.exceptions.RequestException:
+            image_response.close()
+            raise
+        image_response.raw.decode_content = True
+        return image_response
+    
+    def _upload_image_and_post(self, text: str, image_data: Dict[str, Any], image_future: Future) -> Dict[str, Any]:
+        """Register and upload the image, then publish the post referencing it"""
+        # Register the image upload
+        upload_data = self._request('POST', self._register_upload_url, json_body=image_data)
+        
+        # Upload the image
+        upload_url = upload_data['value']['uploadMechanism']['com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest']['uploadUrl']
+        asset_id = upload_data['value']['asset']
+        
+        upload_headers = upload_data['value']['uploadMechanism']['com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest']['headers']
+        upload_headers['Content-Type'] = 'application/octet-stream'
+        
+        # Stream the image from its source straight into the upload, without buffering it
+        image_response = image_future.result()
+        self._request('POST', upload_url, session=self.upload_session, decode=False,
+                      headers=upload_headers, data=image_response.raw)
+        
+        # Create the post with image
+        media = [
+            {
+                "status": "READY",
+                "description": {
+                    "text": "Frontend technology insight"
                 },
-                "visibility": {
-                    "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
+                "media": asset_id,
+                "title": {
+                    "text": "Frontend Tech"
                 }
             }
-            
-            response = requests.post(
-                f'{self.base_url}/ugcPosts',
-                headers=self.headers,
-                data=json.dumps(post_data)
-            )
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Error creating post with image: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Response content: {e.response.text}")
-            raise
+        ]
+        post_data = _build_ugc_post(self._author_urn, text, media)
+        
+        return self._request('POST', self._ugc_url, json_body=post_data)
     
     def test_connection(self) -> bool:
         """Test if the LinkedIn API connection is working"""
@@ -1,23 +1,57 @@
-import schedule
 import time
+import queue
+import signal
+import threading
+import atexit
 import logging
-from datetime import datetime
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
 from config import Config
 from linkedin_api import LinkedInAPI
 from content_generator import ContentGenerator
 
+def _setup_logging():
+    """Log to file and console from a background thread, so logging calls never block on I/O"""
+    root = logging.getLogger()
+    if root.handlers:
+        # Already configured, same as logging.basicConfig
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler('linkedin_bot.log'), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush queued records when the process exits
+    atexit.register(listener.stop)
+    
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
 # Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('linkedin_bot.log'),
-        logging.StreamHandler()
-    ]
-)
+_setup_logging()
 logger = logging.getLogger(__name__)
 
+def _parse_post_time(value: str) -> Tuple[int, int, int]:
+    """Parse an HH:MM or HH:MM:SS post time into (hour, minute, second)"""
+    parts = value.strip().split(':')
+    try:
+        if len(parts) not in (2, 3):
+            raise ValueError
+        hour, minute, second = (int(part) for part in parts + ['0'] * (3 - len(parts)))
+        if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"Invalid POST_TIME {value!r}, expected HH:MM or HH:MM:SS") from None
+    return hour, minute, second
+
+# Posts generated per provider call while the scheduler runs; one-shot commands generate one
+SCHEDULER_BATCH_SIZE = 8
+
 class LinkedInBot:
     """Main bot class for automated LinkedIn posting"""
     
@@ -25,13 +59,19 @@ class LinkedInBot:
         self.linkedin_api = LinkedInAPI()
         self.content_generator = ContentGenerator()
         self.is_running = False
+        # Set by stop_scheduler to wake the scheduler loop immediately
+        self._stop_event = threading.Event()
+        
+        # (timezone, (hour, minute, second)) of the daily post, resolved on first use so a bad
+        # TIMEZONE or POST_TIME only affects the commands that schedule
+        self._post_schedule = None
         
         # Validate configuration
         try:
             Config.validate_config()
             logger.info("Configuration validated successfully")
         except ValueError as e:
-            logger.error(f"Configuration error: {e}")
+            logger.error("Configuration error: %s", e)
             raise
     
     def test_connection(self) -> bool:
@@ -50,9 +90,9 @@ class LinkedInBot:
             logger.info("Starting post creation process...")
             
             # Generate content
-            logger.info(f"Generating content for topic: {topic or 'random'}")
+            logger.info("Generating content for topic: %s", topic or 'random')
             content = self.content_generator.generate_post(topic)
-            logger.info(f"Generated content: {content[:100]}...")
+            logger.info("Generated content: %.100s...", content)
             
             # Post to LinkedIn
             logger.info("Posting to LinkedIn...")
@@ -60,14 +100,14 @@ class LinkedInBot:
             
             if result:
                 logger.info("Post created successfully!")
-                logger.info(f"Post ID: {result.get('id', 'Unknown')}")
+                logger.info("Post ID: %s", result.get('id', 'Unknown'))
                 return True
             else:
                 logger.error("Failed to create post")
                 return False
                 
         except Exception as e:
-            logger.error(f"Error in create_and_post: {e}")
+            logger.error("Error in create_and_post: %s", e)
             return False
     
     def scheduled_post(self):
@@ -82,22 +122,38 @@ class LinkedInBot:
     
     def start_scheduler(self):
         """Start the daily posting scheduler"""
+        # Fail fast on a bad TIMEZONE or POST_TIME
+        self._get_post_schedule()
+        
         if not self.test_connection():
             logger.error("Cannot start scheduler - LinkedIn API connection failed")
             return False
         
-        # Schedule daily posts
-        schedule.every().day.at(Config.POST_TIME).do(self.scheduled_post)
-        
-        logger.info(f"Scheduler started - posts will be made daily at {Config.POST_TIME} {Config.TIMEZONE}")
+        logger.info("Scheduler started - posts will be made daily at %s %s", Config.POST_TIME, Config.TIMEZONE)
         logger.info("Bot is running. Press Ctrl+C to stop.")
         
         self.is_running = True
+        self._stop_event.clear()
+        # Generate posts ahead of time only in the long-running process, which will use them
+        self.content_generator.batch_size = SCHEDULER_BATCH_SIZE
+        
+        # Let container runtimes stop the bot gracefully (signals can only be set from the main thread)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop_scheduler())
+        
+        target = self._next_post_datetime().timestamp()
         
         try:
-            while self.is_running:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            while not self._stop_event.is_set():
+                # Wait until the absolute post time, re-checking the clock after every wake-up;
+                # stop_scheduler ends the wait immediately
+                delta = target - time.time()
+                if delta > 0:
+                    self._stop_event.wait(timeout=delta)
+                    continue
+                
+                self.scheduled_post()
+                target = self._next_post_datetime().timestamp()
         except KeyboardInterrupt:
             logger.info("Bot stopped by user")
             self.stop_scheduler()
@@ -105,9 +161,24 @@ class LinkedInBot:
     def stop_scheduler(self):
         """Stop the scheduler"""
         self.is_running = False
-        schedule.clear()
+        self._stop_event.set()
         logger.info("Scheduler stopped")
     
+    def _get_post_schedule(self):
+        """Timezone and (hour, minute, second) of the daily post, parsed once"""
+        if self._post_schedule is None:
+            self._post_schedule = (Config.get_timezone(), _parse_post_time(Config.POST_TIME))
+        return self._post_schedule
+    
+    def _next_post_datetime(self) -> datetime:
+        """Next occurrence of POST_TIME in the configured timezone"""
+        tz, (hour, minute, second) = self._get_post_schedule()
+        now = datetime.now(tz)
+        target = now.replace(hour=hour, minute=minute, second=second, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return target
+    
     def post_now(self, topic: Optional[str] = None) -> bool:
         """Create and post content immediately"""
         logger.info("Creating immediate post...")
@@ -115,10 +186,7 @@ class LinkedInBot:
     
     def get_next_post_time(self) -> str:
         """Get the next scheduled post time"""
-        next_run = schedule.next_run()
-        if next_run:
-            return next_run.strftime("%Y-%m-%d %H:%M:%S")
-        return "No posts scheduled"
+        return self._next_post_datetime().strftime("%Y-%m-%d %H:%M:%S %Z")
 
 def main():
     """Main function to run the bot"""
@@ -134,7 +202,7 @@ def main():
         bot.start_scheduler()
         
     except Exception as e:
-        logger.error(f"Bot startup failed: {e}")
+        logger.error("Bot startup failed: %s", e)
 
 if __name__ == "__main__":
     main()
@@ -3,26 +3,33 @@
 LinkedIn OAuth Helper - Helper script to get LinkedIn access token
 """
 
-import webbrowser
+import secrets
 import urllib.parse
 import requests
 import json
 from config import Config
+from linkedin_api import NO_RETRY, create_session
+
+# Authorization parameters that do not change between requests
+_AUTH_PARAMS_BASE = {
+    'response_type': 'code',
+    'scope': 'r_liteprofile w_member_social'
+}
 
 def get_authorization_url():
     """Generate LinkedIn authorization URL"""
     params = {
-        'response_type': 'code',
+        **_AUTH_PARAMS_BASE,
         'client_id': Config.LINKEDIN_CLIENT_ID,
         'redirect_uri': Config.LINKEDIN_REDIRECT_URI,
-        'state': 'random_state_string',
-        'scope': 'r_liteprofile w_member_social'
+        # Fresh, unguessable state for every authorization request
+        'state': secrets.token_urlsafe(16)
     }
     
     auth_url = Config.LINKEDIN_AUTH_URL + '?' + urllib.parse.urlencode(params)
     return auth_url
 
-def exchange_code_for_token(authorization_code):
+def exchange_code_for_token(authorization_code, session=None):
     """Exchange authorization code for access token"""
     token_data = {
         'grant_type': 'authorization_code',
@@ -32,7 +39,7 @@ def exchange_code_for_token(authorization_code):
         'client_secret': Config.LINKEDIN_CLIENT_SECRET
     }
     
-    response = requests.post(Config.LINKEDIN_TOKEN_URL, data=token_data)
+    response = (session or requests).post(Config.LINKEDIN_TOKEN_URL, data=token_data)
     
     if response.status_code == 200:
         return response.json()
@@ -57,6 +64,8 @@ def main():
     print(f"Authorization URL: {auth_url}")
     
     try:
+        # Imported here since it probes for available browsers on import
+        import webbrowser
         webbrowser.open(auth_url)
         print("✅ Browser opened. Please authorize the application.")
     except Exception as e:
@@ -73,7 +82,10 @@ def main():
         return
     
     print("\n3. Exchanging code for access token...")
-    token_response = exchange_code_for_token(authorization_code)
+    # One pooled session for the token exchange and the test call below. Authorization codes
+    # are single-use, so a retry after LinkedIn consumed the code would only fail with invalid_grant
+    session = create_session(retry=NO_RETRY)
+    token_response = exchange_code_for_token(authorization_code, session)
     
     if token_response and 'access_token' in token_response:
         access_token = token_response['access_token']
@@ -88,7 +100,7 @@ def main():
             'Content-Type': 'application/json'
         }
         
-        test_response = requests.get('https://api.linkedin.com/v2/userinfo', headers=headers)
+        test_response = session.get('https://api.linkedin.com/v2/userinfo', headers=headers)
         if test_response.status_code == 200:
             profile = test_response.json()
             print(f"✅ Token is valid! Connected as: {profile.get('name', '')}")
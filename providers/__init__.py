@@ -0,0 +1,64 @@
+"""
+LLM providers used by ContentGenerator to turn prompts into post text
+"""
+import re
+from typing import Iterable, Optional, Protocol
+from config import Config
+
+# A streamed post is complete once its closing hashtag line is finished
+_HASHTAG_LINE_RE = re.compile(r'\n\n[ \t]*#\w+(?:[ \t]+#\w+)*[ \t]*\n')
+
+class LLMProvider(Protocol):
+    """Interface every LLM provider module implements"""
+    
+    def generate(self, prompt: str, max_tokens: int, early_stop: bool = False) -> str:
+        """Return the stripped completion text for a prompt, streaming and stopping at the post end if early_stop"""
+        ...
+    
+    async def generate_async(self, prompt: str, max_tokens: int) -> str:
+        """Async counterpart of generate"""
+        ...
+
+
+def find_post_end(text: str) -> int:
+    """Return the index where a complete post ends in text, or -1 if more text is needed"""
+    match = _HASHTAG_LINE_RE.search(text)
+    return match.end() if match else -1
+
+
+def read_until_post_end(chunks: Iterable[str]) -> str:
+    """Concatenate streamed text chunks, returning as soon as a complete post has arrived"""
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        end = find_post_end(text)
+        if end != -1:
+            return text[:end].strip()
+    
+    text = text.strip()
+    if not text:
+        # e.g. a blocked or thinking-only reply; callers fall back rather than publish nothing
+        raise ValueError("Provider returned no post text")
+    return text
+
+
+def get_provider(name: Optional[str] = None) -> LLMProvider:
+    """
+    Return the provider module for the given name
+    
+    Args:
+        name: Provider name ("gemini" or "openai"). Defaults to Config.LLM_PROVIDER
+        
+    Returns:
+        The provider module, which implements LLMProvider
+    """
+    name = (name or Config.LLM_PROVIDER).lower()
+    
+    if name == 'gemini':
+        from providers import gemini
+        return gemini
+    if name == 'openai':
+        from providers import openai
+        return openai
+    
+    raise ValueError(f"Unknown LLM provider: {name}")
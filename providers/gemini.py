@@ -0,0 +1,56 @@
+"""
+Google Gemini provider
+"""
+import asyncio
+from config import Config
+from providers import read_until_post_end
+
+# Gemini model shared by every caller, created on first use. The SDK's default gRPC
+# transport keeps one HTTP/2 channel per process, so reusing the model reuses the connection.
+_MODEL = None
+_configured = False
+
+def _get_model():
+    """Return the shared Gemini model, importing and configuring the SDK once"""
+    global _MODEL, _configured
+    if _MODEL is None:
+        # Imported lazily, the SDK pulls in grpc/protobuf
+        import google.generativeai as genai
+        if not _configured:
+            genai.configure(api_key=Config.GEMINI_API_KEY)
+            _configured = True
+        _MODEL = genai.GenerativeModel(Config.GEMINI_MODEL)
+    return _MODEL
+
+def generate(prompt: str, max_tokens: int, early_stop: bool = False) -> str:
+    """Send a prompt to Gemini and return the stripped response text"""
+    # max_tokens is deliberately not sent as max_output_tokens: on Gemini 2.5 models thinking
+    # tokens count toward that limit, so a post-sized cap can leave a reply with no text at all
+    response = _get_model().generate_content(prompt, stream=early_stop)
+    if early_stop:
+        try:
+            return read_until_post_end(_chunk_text(chunk) for chunk in response)
+        finally:
+            _close_stream(response)
+    return response.text.strip()
+
+def _chunk_text(chunk) -> str:
+    """Text of a streamed chunk; chunks without text parts (e.g. the final one) yield nothing"""
+    try:
+        return chunk.text
+    except ValueError:
+        return ""
+
+def _close_stream(response):
+    """Cancel the remainder of a stream that was abandoned once the post was complete"""
+    iterator = getattr(response, '_iterator', None)
+    close = getattr(iterator, 'cancel', None) or getattr(iterator, 'close', None)
+    if close is not None:
+        close()
+
+async def generate_async(prompt: str, max_tokens: int) -> str:
+    """Async counterpart of generate"""
+    # Runs the sync call on the default executor: the SDK caches its grpc.aio client globally,
+    # bound to the first event loop, while the sync channel works from any loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, generate, prompt, max_tokens)
@@ -0,0 +1,81 @@
+"""
+OpenAI provider
+"""
+import asyncio
+from config import Config
+from providers import read_until_post_end
+
+# OpenAI clients shared by every caller, created on first use. The async client's connection
+# pool belongs to the event loop it was created on, so it is stored with that loop.
+_CLIENT = None
+_ASYNC_CLIENT = None
+_ASYNC_CLIENT_LOOP = None
+
+# Keep-alive pool shared by all requests so warm calls skip the TLS handshake
+_MAX_KEEPALIVE_CONNECTIONS = 20
+
+def _http2_available() -> bool:
+    """HTTP/2 in httpx needs the optional h2 package"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def _get_client():
+    """Return the shared synchronous OpenAI client"""
+    global _CLIENT
+    if _CLIENT is None:
+        # Imported lazily, the SDK pulls in httpx/pydantic
+        import httpx
+        import openai
+        http_client = httpx.Client(
+            http2=_http2_available(),
+            limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS)
+        )
+        _CLIENT = openai.OpenAI(api_key=Config.OPENAI_API_KEY, http_client=http_client)
+    return _CLIENT
+
+def _get_async_client():
+    """Return the asynchronous OpenAI client for the running event loop"""
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT_LOOP is not loop:
+        # A client from a previous (now closed) loop cannot be reused, build one for this loop
+        import httpx
+        import openai
+        # HTTP/2 lets concurrent generate_posts requests share one connection
+        http_client = httpx.AsyncClient(
+            http2=_http2_available(),
+            limits=httpx.Limits(max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS)
+        )
+        _ASYNC_CLIENT = openai.AsyncOpenAI(api_key=Config.OPENAI_API_KEY, http_client=http_client)
+        _ASYNC_CLIENT_LOOP = loop
+    return _ASYNC_CLIENT
+
+def generate(prompt: str, max_tokens: int, early_stop: bool = False) -> str:
+    """Send a prompt to OpenAI and return the stripped response text"""
+    response = _get_client().chat.completions.create(
+        model=Config.OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        stream=early_stop
+    )
+    if early_stop:
+        try:
+            return read_until_post_end(
+                chunk.choices[0].delta.content or "" for chunk in response if chunk.choices
+            )
+        finally:
+            # Drops the rest of the stream once the post is complete
+            response.close()
+    return response.choices[0].message.content.strip()
+
+async def generate_async(prompt: str, max_tokens: int) -> str:
+    """Async counterpart of generate"""
+    response = await _get_async_client().chat.completions.create(
+        model=Config.OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens
+    )
+    return response.choices[0].message.content.strip()
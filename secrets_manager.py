@@ -2,13 +2,19 @@
 Utility module for fetching secrets from Google Cloud Secret Manager
 """
 import os
+import re
 import logging
-from typing import Optional, Dict
-from google.cloud import secretmanager
-from google.api_core import exceptions
+from typing import Optional, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# KEY=VALUE lines; comment lines never match because keys cannot start with '#'
+_ENV_LINE_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+# Secret payloads cached for the process lifetime; config.load_environment keeps the
+# on-disk copy across restarts
+_payload_cache: Dict[Tuple[str, str, str], str] = {}
+
 class SecretsManager:
     """Handler for Google Cloud Secret Manager"""
     
@@ -21,9 +27,14 @@ class SecretsManager:
         """
         self.project_id = project_id or os.getenv('GCP_PROJECT')
         self.client = None
+        self._exceptions = None
         
         if self.project_id:
             try:
+                # Imported here so runs without Secret Manager skip grpc/protobuf entirely
+                from google.cloud import secretmanager
+                from google.api_core import exceptions
+                self._exceptions = exceptions
                 self.client = secretmanager.SecretManagerServiceClient()
                 logger.info(f"Secret Manager client initialized for project: {self.project_id}")
             except Exception as e:
@@ -34,7 +45,7 @@ class SecretsManager:
     
     def access_secret(self, secret_id: str, version: str = "latest") -> Optional[str]:
         """
-        Access a secret from Secret Manager
+        Access a secret from Secret Manager, served from the in-process cache after the first fetch
         
         Args:
             secret_id: The ID of the secret to access
@@ -43,7 +54,32 @@ class SecretsManager:
         Returns:
             The secret value as a string, or None if not found
         """
-        if not self.client or not self.project_id:
+        if not self.project_id:
+            logger.warning("Secret Manager client not initialized")
+            return None
+        
+        key = (self.project_id, secret_id, version)
+        payload = _payload_cache.get(key)
+        if payload is None:
+            payload = self._fetch_secret(secret_id, version)
+            if payload is None:
+                return None
+            _payload_cache[key] = payload
+        return payload
+    
+    def invalidate(self, secret_id: str, version: str = "latest"):
+        """
+        Drop a cached secret so the next access refetches it from Secret Manager
+        
+        Args:
+            secret_id: The ID of the secret to invalidate
+            version: Version of the secret (default: "latest")
+        """
+        _payload_cache.pop((self.project_id, secret_id, version), None)
+    
+    def _fetch_secret(self, secret_id: str, version: str) -> Optional[str]:
+        """Fetch a secret payload from Secret Manager"""
+        if not self.client:
             logger.warning("Secret Manager client not initialized")
             return None
         
@@ -59,10 +95,10 @@ class SecretsManager:
             logger.info(f"Successfully accessed secret: {secret_id}")
             return payload
             
-        except exceptions.NotFound:
+        except self._exceptions.NotFound:
             logger.error(f"Secret not found: {secret_id}")
             return None
-        except exceptions.PermissionDenied:
+        except self._exceptions.PermissionDenied:
             logger.error(f"Permission denied accessing secret: {secret_id}")
             return None
         except Exception as e:
@@ -79,58 +115,77 @@ class SecretsManager:
         Returns:
             Dictionary of key-value pairs
         """
-        env_vars = {}
-        
         if not secret_content:
-            return env_vars
-        
-        for line in secret_content.strip().split('\n'):
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse KEY=VALUE
-            if '=' in line:
-                key, value = line.split('=', 1)
-                env_vars[key.strip()] = value.strip()
+            return {}
         
-        return env_vars
+        return {key: value for key, value in _ENV_LINE_RE.findall(secret_content)}
     
-    def load_secret_to_env(self, secret_id: str, version: str = "latest") -> bool:
+    def get_secret_env(self, secret_id: str, version: str = "latest") -> Dict[str, str]:
         """
-        Load a secret from Secret Manager and set as environment variables
+        Access a secret in .env format and parse it into a dictionary
         
         Args:
             secret_id: The ID of the secret to access
             version: Version of the secret (default: "latest")
             
         Returns:
-            True if successful, False otherwise
+            Dictionary of key-value pairs, empty if the secret could not be read
         """
         secret_content = self.access_secret(secret_id, version)
         
         if not secret_content:
             logger.warning(f"No content found for secret: {secret_id}")
-            return False
+            return {}
         
         # Parse the secret content
         env_vars = self.parse_env_format(secret_content)
         
         if not env_vars:
             logger.warning(f"No variables parsed from secret: {secret_id}")
+        
+        return env_vars
+    
+    def load_secret_to_env(self, secret_id: str, version: str = "latest") -> bool:
+        """
+        Load a secret from Secret Manager and set as environment variables
+        
+        Args:
+            secret_id: The ID of the secret to access
+            version: Version of the secret (default: "latest")
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        env_vars = self.get_secret_env(secret_id, version)
+        
+        if not env_vars:
             return False
         
         # Set environment variables
-        for key, value in env_vars.items():
-            os.environ[key] = value
-            logger.debug(f"Set environment variable: {key}")
+        os.environ.update(env_vars)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Set %d environment variables: %s", len(env_vars), ', '.join(env_vars))
         
         logger.info(f"Loaded {len(env_vars)} variables from secret: {secret_id}")
         return True
 
 
+def fetch_secrets_from_gcp(secret_id: str = "linkedin-bot", project_id: Optional[str] = None) -> Dict[str, str]:
+    """
+    Convenience function to fetch and parse secrets from GCP Secret Manager without
+    touching the environment
+    
+    Args:
+        secret_id: The ID of the secret to access (default: "linkedin-bot")
+        project_id: Google Cloud Project ID (optional)
+        
+    Returns:
+        Dictionary of key-value pairs, empty if the secret could not be read
+    """
+    manager = SecretsManager(project_id)
+    return manager.get_secret_env(secret_id)
+
+
 def load_secrets_from_gcp(secret_id: str = "linkedin-bot", project_id: Optional[str] = None) -> bool:
     """
     Convenience function to load secrets from GCP Secret Manager
@@ -1,5 +1,6 @@
 import os
 import sys
+from importlib.metadata import distribution, PackageNotFoundError
 from pathlib import Path
 
 def setup_environment():
@@ -31,15 +32,16 @@ def setup_environment():
 def check_dependencies():
     """Check if all required dependencies are installed"""
     required_packages = [
-        'requests', 'python-dotenv', 'schedule', 'google-generativeai', 'pytz'
+        'requests', 'python-dotenv', 'google-generativeai', 'pytz'
     ]
     
     missing_packages = []
     
     for package in required_packages:
+        # Only reads installed dist-info metadata, no package code is imported
         try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+            distribution(package)
+        except PackageNotFoundError:
             missing_packages.append(package)
     
     if missing_packages:
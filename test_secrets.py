@@ -4,6 +4,11 @@ Test script to verify Secret Manager integration
 """
 import os
 import sys
+import argparse
+import importlib
+
+DEFAULT_PROJECT_ID = "citric-celerity-416705"
+DEFAULT_SECRET_ID = "linkedin-bot"
 
 def test_local_env():
     """Test loading from .env file"""
@@ -33,7 +38,7 @@ def test_local_env():
     
     return success
 
-def test_secret_manager():
+def test_secret_manager(project_id=DEFAULT_PROJECT_ID, secret_id=DEFAULT_SECRET_ID):
     """Test loading from Secret Manager"""
     print("\n" + "=" * 60)
     print("Testing GCP Secret Manager Loading")
@@ -51,14 +56,6 @@ def test_secret_manager():
             del os.environ[var]
     
     # Set up for Secret Manager
-    project_id = input("\nEnter GCP Project ID (default: citric-celerity-416705): ").strip()
-    if not project_id:
-        project_id = "citric-celerity-416705"
-    
-    secret_id = input("Enter Secret ID (default: linkedin-bot): ").strip()
-    if not secret_id:
-        secret_id = "linkedin-bot"
-    
     os.environ['GCP_PROJECT'] = project_id
     os.environ['USE_SECRET_MANAGER'] = 'true'
     os.environ['SECRET_ID'] = secret_id
@@ -67,9 +64,12 @@ def test_secret_manager():
     print(f"From project: {project_id}\n")
     
     try:
-        from secrets_manager import load_secrets_from_gcp
+        from secrets_manager import SecretsManager
         
-        if load_secrets_from_gcp(secret_id, project_id):
+        manager = SecretsManager(project_id)
+        # Always go to Secret Manager, so the check reflects current access rights
+        manager.invalidate(secret_id)
+        if manager.load_secret_to_env(secret_id):
             print("\n✅ Secrets loaded successfully from Secret Manager!\n")
             
             vars_to_check = [
@@ -109,18 +109,19 @@ def test_secret_manager():
         print(f"\n❌ Error: {e}")
         return False
 
-def test_config_integration():
+def test_config_integration(reload=False):
     """Test the config.py integration"""
     print("\n" + "=" * 60)
     print("Testing config.py Integration")
     print("=" * 60)
     
-    # Clear Python module cache
-    if 'config' in sys.modules:
-        del sys.modules['config']
-    
     try:
-        from config import Config
+        import config
+        
+        # Re-read the environment only if secrets were loaded after config was first imported
+        if reload:
+            importlib.reload(config)
+        Config = config.Config
         
         print("\nConfig values:")
         print(f"  LINKEDIN_CLIENT_ID: {Config.LINKEDIN_CLIENT_ID[:15] + '...' if Config.LINKEDIN_CLIENT_ID else 'Not set'}")
@@ -142,52 +143,57 @@ def test_config_integration():
         return False
 
 def main():
+    parser = argparse.ArgumentParser(description='LinkedIn Bot - Secret Manager Testing Tool')
+    subparsers = parser.add_subparsers(dest='command', help='Test to run')
+    subparsers.required = True
+    
+    subparsers.add_parser('local', help='Test local .env file')
+    
+    gcp_parser = subparsers.add_parser('gcp', help='Test GCP Secret Manager')
+    subparsers.add_parser('config', help='Test config.py integration')
+    all_parser = subparsers.add_parser('all', help='Run all tests')
+    
+    for sub_parser in (gcp_parser, all_parser):
+        sub_parser.add_argument('--project', default=DEFAULT_PROJECT_ID,
+                                help=f'GCP Project ID (default: {DEFAULT_PROJECT_ID})')
+        sub_parser.add_argument('--secret', default=DEFAULT_SECRET_ID,
+                                help=f'Secret ID (default: {DEFAULT_SECRET_ID})')
+    
+    args = parser.parse_args()
+    
     print("\n🔐 LinkedIn Bot - Secret Manager Testing Tool\n")
     
-    while True:
-        print("\nSelect test mode:")
-        print("1. Test local .env file")
-        print("2. Test GCP Secret Manager")
-        print("3. Test config.py integration")
-        print("4. Run all tests")
-        print("0. Exit")
+    if args.command == 'local':
+        success = test_local_env()
+    elif args.command == 'gcp':
+        success = test_secret_manager(args.project, args.secret)
+    elif args.command == 'config':
+        success = test_config_integration()
+    else:
+        print("\n" + "=" * 60)
+        print("RUNNING ALL TESTS")
+        print("=" * 60)
         
-        choice = input("\nEnter choice (0-4): ").strip()
+        # Test 1: Local env
+        result1 = test_local_env()
         
-        if choice == '0':
-            print("\nGoodbye! 👋")
-            break
-        elif choice == '1':
-            test_local_env()
-        elif choice == '2':
-            test_secret_manager()
-        elif choice == '3':
-            test_config_integration()
-        elif choice == '4':
-            print("\n" + "=" * 60)
-            print("RUNNING ALL TESTS")
-            print("=" * 60)
-            
-            # Test 1: Local env
-            result1 = test_local_env()
-            
-            # Test 2: Secret Manager
-            result2 = test_secret_manager()
-            
-            # Test 3: Config integration
-            result3 = test_config_integration()
-            
-            print("\n" + "=" * 60)
-            print("TEST SUMMARY")
-            print("=" * 60)
-            print(f"Local .env:         {'✅ PASS' if result1 else '❌ FAIL'}")
-            print(f"Secret Manager:     {'✅ PASS' if result2 else '❌ FAIL'}")
-            print(f"Config Integration: {'✅ PASS' if result3 else '❌ FAIL'}")
-            print()
-        else:
-            print("❌ Invalid choice. Please try again.")
+        # Test 2: Secret Manager
+        config_loaded = 'config' in sys.modules
+        result2 = test_secret_manager(args.project, args.secret)
         
-        input("\nPress Enter to continue...")
+        # Test 3: Config integration
+        result3 = test_config_integration(reload=result2 and config_loaded)
+        
+        print("\n" + "=" * 60)
+        print("TEST SUMMARY")
+        print("=" * 60)
+        print(f"Local .env:         {'✅ PASS' if result1 else '❌ FAIL'}")
+        print(f"Secret Manager:     {'✅ PASS' if result2 else '❌ FAIL'}")
+        print(f"Config Integration: {'✅ PASS' if result3 else '❌ FAIL'}")
+        print()
+        success = result1 and result2 and result3
+    
+    sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     try: